@@ -1,13 +1,58 @@
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
-from pydantic import BaseModel, PrivateAttr
 
+class CacheHandler:
+    """
+    In-memory LRU cache of tool outputs keyed by `(tool, input)`.
+    Hold up to `maxsize` entries and drop the least recently used one when it is full.
+    When `ttl` (in seconds) is given, entries older than that are treated as missing.
+    """
 
-class CacheHandler(BaseModel):
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    __slots__ = ("_cache", "_lock", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = None):
+        self._cache: OrderedDict[Tuple[Any, str], Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __getstate__(self):
+        with self._lock:
+            return (OrderedDict(self._cache), self.maxsize, self.ttl)
+
+    def __setstate__(self, state):
+        # locks cannot be copied or pickled, so create a new one.
+        self._cache, self.maxsize, self.ttl = state
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(tool, input) -> Tuple[Any, str]:
+        # key by the string form of the input, as `CacheTool.hit_cache` reads with the string it parses out of the key.
+        # this also accepts unhashable inputs such as dict arguments.
+        return (tool, str(input))
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        key = self._key(tool, input)
+        with self._lock:
+            self._cache[key] = (time.monotonic(), output)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self._key(tool, input)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            added_at, output = entry
+            if self.ttl is not None and time.monotonic() - added_at > self.ttl:
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return output
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 import uuid
 from abc import ABC
@@ -168,7 +170,7 @@ class Agent(ABC, BaseModel):
         default=True, description="Whether the agent should use a cache for tool usage."
     )
     cache_handler: InstanceOf[CacheHandler] = Field(
-        default=None, description="An instance of the CacheHandler class."
+        default=None, exclude=True, description="An instance of the CacheHandler class."
     )
     formatting_errors: int = Field(
         default=0, description="Number of formatting errors."
@@ -371,6 +373,34 @@ class Agent(ABC, BaseModel):
 
         return self
 
+    def _create_messages(self, prompts: str) -> List[Dict[str, str]]:
+        messages = []
+        messages.append({"role": "user", "content": prompts})  #! REFINEME
+        messages.append({"role": "assistant", "content": self.backstory})
+        return messages
+
+    def _check_response(self, response: Any) -> None:
+        """
+        Raise an error when the first response is None or empty and no retry is allowed.
+        """
+
+        if (response is None or response == "") and self.max_retry_limit <= 1:
+            logging.error("Received None or empty response from LLM call.")
+            raise ValueError("Invalid response from LLM call - None or empty.")
+
+    def _should_retry(self, response: Any, task_execution_counter: int) -> bool:
+        """
+        Return True when the base model needs to be called again after `task_execution_counter` calls.
+        """
+
+        if response is not None and response != "":
+            return False
+        return task_execution_counter <= self.max_retry_limit
+
+    @staticmethod
+    def _format_response(response: Any) -> Dict[str, Any]:
+        return {"output": response.output if hasattr(response, "output") else response}
+
     def invoke(
         self,
         prompts: str,
@@ -384,42 +414,82 @@ class Agent(ABC, BaseModel):
         When encountering errors, we try the task execution up to `self.max_retry_limit` times.
         """
 
-        task_execution_counter = 0
+        messages = self._create_messages(prompts)
+        callbacks = kwargs.get("callbacks", None)
 
-        messages = []
-        messages.append({"role": "user", "content": prompts})  #! REFINEME
-        messages.append({"role": "assistant", "content": self.backstory})
-        print("Messages sent to the model:", messages)
+        response = self.llm.call(
+            messages=messages,
+            output_formats=output_formats,
+            field_list=response_fields,
+            callbacks=callbacks,
+        )
+        task_execution_counter = 1
+        self._check_response(response)
+
+        while self._should_retry(response, task_execution_counter):
+            response = self.llm.call(
+                messages=messages,
+                output_formats=output_formats,
+                field_list=response_fields,
+                callbacks=callbacks,
+            )
+            task_execution_counter += 1
 
+        return self._format_response(response)
+
+    async def invoke_async(
+        self,
+        prompts: str,
+        output_formats: List[TaskOutputFormat],
+        response_fields: List[ResponseField],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async version of `invoke`. Await the base model call instead of blocking the thread.
+        """
+
+        messages = self._create_messages(prompts)
         callbacks = kwargs.get("callbacks", None)
 
-        response = self.llm.call(
+        response = await self.llm.call_async(
             messages=messages,
             output_formats=output_formats,
             field_list=response_fields,
             callbacks=callbacks,
         )
-        task_execution_counter += 1
-        print("Agent's #1 res: ", response)
-
-        if (
-            response is None or response == ""
-        ) and task_execution_counter < self.max_retry_limit:
-            while task_execution_counter <= self.max_retry_limit:
-                response = self.llm.call(
-                    messages=messages,
-                    output_formats=output_formats,
-                    field_list=response_fields,
-                    callbacks=callbacks,
-                )
-                task_execution_counter += 1
-                print(f"Agent's #{task_execution_counter} res: ", response)
+        task_execution_counter = 1
+        self._check_response(response)
+
+        while self._should_retry(response, task_execution_counter):
+            response = await self.llm.call_async(
+                messages=messages,
+                output_formats=output_formats,
+                field_list=response_fields,
+                callbacks=callbacks,
+            )
+            task_execution_counter += 1
 
-        elif response is None or response == "":
-            print("Received None or empty response from LLM call.")
-            raise ValueError("Invalid response from LLM call - None or empty.")
+        return self._format_response(response)
 
-        return {"output": response.output if hasattr(response, "output") else response}
+    def _run_tools(self, task) -> List[Any]:
+        tool_results = []
+        for tool_called in task.tools_called:
+            tool_result = tool_called.tool.run()
+            tool_results.append(tool_result)
+        return tool_results
+
+    def _handle_execution_error(self, error: Exception) -> None:
+        """
+        Count the failed execution and raise the error once it exceeds `max_retry_limit`.
+        """
+
+        self._times_executed += 1
+        if self._times_executed > self.max_retry_limit:
+            raise error
+
+    def _stop_rpm_counter(self) -> None:
+        if self.max_rpm and self._rpm_controller:
+            self._rpm_controller.stop_rpm_counter()
 
     def execute_task(self, task, context: Optional[str] = None) -> str:
         """
@@ -433,12 +503,8 @@ class Agent(ABC, BaseModel):
         # if context:
         #     task_prompt = self.i18n.slice("task_with_context").format(task=task_prompt, context=context)
 
-        tool_results = []
         if task.tools_called:
-            for tool_called in task.tools_called:
-                tool_result = tool_called.tool.run()
-                tool_results.append(tool_result)
-
+            tool_results = self._run_tools(task)
             if task.take_tool_res_as_final:
                 return tool_results
 
@@ -455,18 +521,42 @@ class Agent(ABC, BaseModel):
             )["output"]
 
         except Exception as e:
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                raise e
-            result = self.execute_task(
-                task, context, [tool_called.tool for tool_called in task.tools_called]
-            )
+            self._handle_execution_error(e)
+            result = self.execute_task(task, context)
 
-        if self.max_rpm and self._rpm_controller:
-            self._rpm_controller.stop_rpm_counter()
+        self._stop_rpm_counter()
 
         # for tool_result in self.tools_results:
         #     if tool_result.get("result_as_answer", False):
         #         result = tool_result["result"]
 
         return result
+
+    async def execute_task_async(self, task, context: Optional[str] = None) -> str:
+        """
+        Async version of `execute_task`. Tools are synchronous, so they run in a worker thread.
+        """
+
+        task_prompt = task.prompt()
+
+        if task.tools_called:
+            tool_results = await asyncio.to_thread(self._run_tools, task)
+            if task.take_tool_res_as_final:
+                return tool_results
+
+        try:
+            result = (
+                await self.invoke_async(
+                    prompts=task_prompt,
+                    output_formats=task.expected_output_formats,
+                    response_fields=task.output_field_list,
+                )
+            )["output"]
+
+        except Exception as e:
+            self._handle_execution_error(e)
+            result = await self.execute_task_async(task, context)
+
+        self._stop_rpm_counter()
+
+        return result
@@ -16,7 +16,6 @@ from versionhq.task.model import ResponseField
 load_dotenv(override=True)
 API_KEY_LITELLM = os.environ.get("API_KEY_LITELLM")
 DEFAULT_CONTEXT_WINDOW = int(8192 * 0.75)
-os.environ["LITELLM_LOG"] = "DEBUG"
 
 
 class FilteredStream:
@@ -152,6 +151,31 @@ class LLM:
         litellm.drop_params = True
         self.set_callbacks(callbacks)
 
+    def _create_params(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "timeout": self.timeout,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "n": self.n,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens or self.max_completion_tokens,
+            "presence_penalty": self.presence_penalty,
+            "frequency_penalty": self.frequency_penalty,
+            "logit_bias": self.logit_bias,
+            # "response_format": response_format,
+            "seed": self.seed,
+            "logprobs": self.logprobs,
+            "top_logprobs": self.top_logprobs,
+            "api_base": self.base_url,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            "stream": False,
+            **self.kwargs,
+        }
+        return {k: v for k, v in params.items() if v is not None}
+
     def call(
         self,
         output_formats: List[TaskOutputFormat],
@@ -176,29 +200,7 @@ class LLM:
                         response_type="json_object", field_list=field_list
                     )
 
-                params = {
-                    "model": self.model,
-                    "messages": messages,
-                    "timeout": self.timeout,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p,
-                    "n": self.n,
-                    "stop": self.stop,
-                    "max_tokens": self.max_tokens or self.max_completion_tokens,
-                    "presence_penalty": self.presence_penalty,
-                    "frequency_penalty": self.frequency_penalty,
-                    "logit_bias": self.logit_bias,
-                    # "response_format": response_format,
-                    "seed": self.seed,
-                    "logprobs": self.logprobs,
-                    "top_logprobs": self.top_logprobs,
-                    "api_base": self.base_url,
-                    "api_version": self.api_version,
-                    "api_key": self.api_key,
-                    "stream": False,
-                    **self.kwargs,
-                }
-                params = {k: v for k, v in params.items() if v is not None}
+                params = self._create_params(messages=messages)
                 res = litellm.completion(**params)
                 return res["choices"][0]["message"]["content"]
 
@@ -206,6 +208,30 @@ class LLM:
                 logging.error(f"LiteLLM call failed: {str(e)}")
                 return None
 
+    async def call_async(
+        self,
+        output_formats: List[TaskOutputFormat],
+        field_list: Optional[List[ResponseField]],
+        messages: List[Dict[str, str]],
+        callbacks: List[Any] = [],
+    ) -> str:
+        """
+        Execute LLM based on Agent's controls without blocking the event loop.
+        (Memo) `suppress_warnings` swaps `sys.stdout` globally, so it is not used across concurrent awaits.
+        """
+
+        if callbacks and len(callbacks) > 0:
+            self.set_callbacks(callbacks)
+
+        try:
+            params = self._create_params(messages=messages)
+            res = await litellm.acompletion(**params)
+            return res["choices"][0]["message"]["content"]
+
+        except Exception as e:
+            logging.error(f"LiteLLM call failed: {str(e)}")
+            return None
+
     def supports_function_calling(self) -> bool:
         try:
             params = get_supported_openai_params(model=self.model)
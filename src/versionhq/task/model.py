@@ -1,13 +1,17 @@
-import json
-import threading
+import ast
+import atexit
+import os
 import uuid
-from concurrent.futures import Future
-from hashlib import md5
-from typing import Any, Dict, List, Set, Optional, Tuple, Callable
+from functools import cached_property
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha256
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Callable
 
+import orjson
 from pydantic import (
     UUID4,
     BaseModel,
+    ConfigDict,
     Field,
     PrivateAttr,
     field_validator,
@@ -19,12 +23,48 @@ from versionhq._utils.process_config import process_config
 from versionhq.task import TaskOutputFormat
 from versionhq.tool.model import Tool, ToolCalled
 
+_TASK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="task"
+)
+
+
+def shutdown_tasks(wait: bool = True) -> None:
+    """
+    Shut down the shared executor that runs tasks asynchronously.
+    """
+    _TASK_EXECUTOR.shutdown(wait=wait)
+
+
+atexit.register(shutdown_tasks)
+
+# fields that `Task.key` is derived from
+_KEY_FIELDS = frozenset(
+    {
+        "description",
+        "expected_output_json",
+        "expected_output_pydantic",
+        "expected_output_raw",
+    }
+)
+
+# fields that `Task.output_prompt` and `Task.expected_output_formats` are derived from
+_OUTPUT_FIELDS = frozenset(
+    {
+        "expected_output_json",
+        "expected_output_pydantic",
+        "expected_output_raw",
+        "output_field_list",
+    }
+)
+
 
 class ResponseField(BaseModel):
     """
     Field class to use in the response schema for the JSON response.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(default=None)
     type: str = Field(default=None)
     required: bool = Field(default=True)
@@ -36,6 +76,8 @@ class TaskOutput(BaseModel):
     Depending on the task output format, use `raw`, `pydantic`, `json_dict` accordingly.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     class AgentOutput(BaseModel):
         """
         Keep adding agents' learning and recommendation and store it in `pydantic` field of `TaskOutput` class.
@@ -84,8 +126,15 @@ class TaskOutput(BaseModel):
         )
 
     @property
-    def json(self) -> Optional[str]:
-        if self.output_format != TaskOutputFormat.JSON:
+    def json(self) -> str:
+        return self.json_bytes.decode()
+
+    @property
+    def json_bytes(self) -> bytes:
+        """
+        Serialize `json_dict` with orjson. Use this when the caller writes the output as-is (e.g. a HTTP response body).
+        """
+        if self.json_dict is None:
             raise ValueError(
                 """
                 Invalid output format requested.
@@ -93,7 +142,7 @@ class TaskOutput(BaseModel):
                 pleae make sure to set the output_json property for the task
                 """
             )
-        return json.dumps(self.json_dict)
+        return orjson.dumps(self.json_dict, option=orjson.OPT_NON_STR_KEYS)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert json_output and pydantic_output to a dictionary."""
@@ -122,15 +171,16 @@ class Task(BaseModel):
     name: Optional[str] = Field(default=None)
     description: str = Field(description="Description of the actual task")
     _original_description: str = PrivateAttr(default=None)
+    _expected_output_formats: Tuple[TaskOutputFormat, ...] = PrivateAttr(default=())
+    _output_prompt: str = PrivateAttr(default="")
 
     # output
     expected_output_raw: bool = Field(default=False)
     expected_output_json: bool = Field(default=True)
     expected_output_pydantic: bool = Field(default=False)
-    output_field_list: Optional[List[ResponseField]] = Field(
-        default=[
-            ResponseField(title="output", type="str", required=True),
-        ]
+    output_field_list: Optional[Tuple[ResponseField, ...]] = Field(
+        default=(ResponseField(title="output", type="str", required=True),),
+        description="stored as a tuple. reassign the field to change it, so that the output prompt is recomputed",
     )
     output: Optional[TaskOutput] = Field(
         default=None, description="store the final task output in TaskOutput class"
@@ -161,29 +211,40 @@ class Task(BaseModel):
     )
 
     # recording
-    processed_by_agents: Set[str] = Field(default_factory=set)
+    processed_by_agents: Tuple[str, ...] = Field(default_factory=tuple)
     used_tools: int = 0
     tools_errors: int = 0
     delegations: int = 0
 
-    @property
-    def output_prompt(self):
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "output_field_list" and value is not None:
+            value = tuple(value)
+        super().__setattr__(name, value)
+        if name in _KEY_FIELDS:
+            self.__dict__.pop("key", None)
+        if name in _OUTPUT_FIELDS:
+            self._set_output_attributes()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Task":
         """
-        Draft prompts on the output format by converting `output_field_list` to dictionary.
+        Copy the task. `update` bypasses `__setattr__`, so recompute the derived attributes on the copy.
         """
 
-        output_prompt, output_dict = "", dict()
-        for item in self.output_field_list:
-            output_dict[item.title] = f"your answer in {item.type}"
+        if update and update.get("output_field_list") is not None:
+            update = {**update, "output_field_list": tuple(update["output_field_list"])}
+        task = super().model_copy(update=update, deep=deep)
+        if update:
+            task.__dict__.pop("key", None)
+            task._set_output_attributes()
+        return task
 
-        output_prompt = f"""
-        The output formats include the following format:
-        {output_dict}
+    def _set_output_attributes(self) -> None:
+        """
+        Precompute the expected output formats and the output prompt from the output settings.
         """
-        return output_prompt
 
-    @property
-    def expected_output_formats(self) -> List[TaskOutputFormat]:
         outputs = []
         if self.expected_output_json:
             outputs.append(TaskOutputFormat.JSON)
@@ -191,21 +252,35 @@ class Task(BaseModel):
             outputs.append(TaskOutputFormat.PYDANTIC)
         if self.expected_output_raw:
             outputs.append(TaskOutputFormat.RAW)
-        return outputs
+        self._expected_output_formats = tuple(outputs)
+
+        json_example = orjson.dumps(
+            {
+                item.title: f"your answer in {item.type}"
+                for item in self.output_field_list or ()
+            },
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+        self._output_prompt = f"""
+        The output formats include the following JSON format:
+        {json_example}
+        """
 
     @property
+    def output_prompt(self) -> str:
+        """
+        Draft prompts on the output format by converting `output_field_list` to a JSON example.
+        """
+        return self._output_prompt
+
+    @property
+    def expected_output_formats(self) -> Tuple[TaskOutputFormat, ...]:
+        return self._expected_output_formats
+
+    @cached_property
     def key(self) -> str:
-        output_format = (
-            TaskOutputFormat.JSON
-            if self.expected_output_json == True
-            else (
-                TaskOutputFormat.PYDANTIC
-                if self.expected_output_pydantic == True
-                else TaskOutputFormat.RAW
-            )
-        )
-        source = [self.description, output_format]
-        return md5("|".join(source).encode(), usedforsecurity=False).hexdigest()
+        source = [self.description, self._get_output_format()]
+        return sha256("|".join(source).encode(), usedforsecurity=False).hexdigest()
 
     @property
     def summary(self) -> str:
@@ -231,7 +306,12 @@ class Task(BaseModel):
             )
 
     @model_validator(mode="after")
-    def validate_required_fields(self):
+    def validate_fields_and_output_format(self) -> "Task":
+        """
+        Check the required fields, set attributes based on the task configuration, then check the output format.
+        Run in a single validator to avoid dispatching several after-validators per instance.
+        """
+
         required_fields = [
             "description",
         ]
@@ -240,32 +320,28 @@ class Task(BaseModel):
                 raise ValueError(
                     f"{field} must be provided either directly or through config"
                 )
-        return self
-
-    @model_validator(mode="after")
-    def set_attributes_based_on_config(self) -> "Task":
-        """
-        Set attributes based on the agent configuration.
-        """
 
         if self.config:
             for key, value in self.config.items():
                 setattr(self, key, value)
-        return self
 
-    @model_validator(mode="after")
-    def validate_output_format(self):
-        if (
-            self.expected_output_json == False
-            and self.expected_output_pydantic == False
-            and self.expeceted_output_raw == False
+        if not (
+            self.expected_output_json
+            or self.expected_output_pydantic
+            or self.expected_output_raw
         ):
-            raise PydanticCustomError("Need to choose at least one output format.")
+            raise PydanticCustomError(
+                "missing_output_format",
+                "Need to choose at least one output format.",
+                {},
+            )
+
+        self._set_output_attributes()
         return self
 
     @model_validator(mode="after")
     def backup_description(self):
-        if self._original_description == None:
+        if self._original_description is None:
             self._original_description = self.description
         return self
 
@@ -284,47 +360,39 @@ class Task(BaseModel):
 
     def _export_output(
         self, result: Any
-    ) -> Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]:
-        output_pydantic: Optional[BaseModel] = None
-        output_json: Optional[Dict[str, Any]] = None
-        dict_output = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[BaseModel]]:
+        """
+        Convert the agent's result into the JSON dict and the pydantic output that the task expects.
+        """
+
+        if isinstance(result, BaseModel):
+            return (
+                result.model_dump() if self.expected_output_json else None,
+                result if self.expected_output_pydantic else None,
+            )
+
+        if isinstance(result, dict):
+            return (result if self.expected_output_json else None, None)
 
         if isinstance(result, str):
+            if not self.expected_output_json:
+                return (None, None)
             try:
-                dict_output = json.loads(result)
-            except json.JSONDecodeError:
+                dict_output = orjson.loads(result)
+            except orjson.JSONDecodeError:
                 try:
-                    dict_output = eval(result)
-                except:
-                    try:
-                        import ast
-
-                        dict_output = ast.literal_eval(result)
-                    except:
-                        dict_output = None
+                    dict_output = ast.literal_eval(result)
+                except Exception:
+                    dict_output = None
+            # the model may reply with valid JSON or literals that are not objects, e.g. "42" or "[1, 2]".
+            return (dict_output if isinstance(dict_output, dict) else None, None)
 
-        if self.expected_output_json:
-            if isinstance(result, dict):
-                output_json = result
-            elif isinstance(result, BaseModel):
-                output_json = result.model_dump()
-            else:
-                output_json = dict_output
-
-        if self.expected_output_pydantic:
-            if isinstance(result, BaseModel):
-                output_pydantic = result
-            elif isinstance(result, dict):
-                output_json = result
-            else:
-                output_pydantic = None
-
-        return output_json, output_pydantic
+        return (None, None)
 
     def _get_output_format(self) -> TaskOutputFormat:
-        if self.output_json == True:
+        if self.expected_output_json:
             return TaskOutputFormat.JSON
-        if self.output_pydantic == True:
+        if self.expected_output_pydantic:
             return TaskOutputFormat.PYDANTIC
         return TaskOutputFormat.RAW
 
@@ -345,23 +413,9 @@ class Task(BaseModel):
 
     def execute_async(self, agent, context: Optional[str] = None) -> Future[TaskOutput]:
         """
-        Execute the task asynchronously.
+        Execute the task asynchronously on the shared task executor.
         """
-
-        future: Future[TaskOutput] = Future()
-        threading.Thread(
-            daemon=True,
-            target=self._execute_task_async,
-            args=(agent, context, future),
-        ).start()
-        return future
-
-    def _execute_task_async(
-        self, agent, context: Optional[str], future: Future[TaskOutput]
-    ) -> None:
-        """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context)
-        future.set_result(result)
+        return _TASK_EXECUTOR.submit(self._execute_core, agent, context)
 
     def _execute_core(self, agent, context: Optional[str]) -> TaskOutput:
         """
@@ -370,15 +424,37 @@ class Task(BaseModel):
 
         self.prompt_context = context
         result = agent.execute_task(task=self, context=context)
+        return self._handle_result(agent, result)
+
+    async def execute_async_coro(
+        self, agent, context: Optional[str] = None
+    ) -> TaskOutput:
+        """
+        Execute the task as a coroutine so that I/O-bound agent calls run on the event loop without threads.
+        i.e., `await asyncio.gather(*(task.execute_async_coro(agent) for task in tasks))`
+        """
+
+        self.prompt_context = context
+        result = await agent.execute_task_async(task=self, context=context)
+        return self._handle_result(agent, result)
+
+    def _handle_result(self, agent, result: Any) -> TaskOutput:
+        """
+        Store the agent's result in TaskOutput and run the callback if any.
+        """
+
         output_json, output_pydantic = self._export_output(result)
-        task_output = TaskOutput(
+        # `model_construct` skips validation, so make sure `raw` is a string. Tools can return any object.
+        raw = "" if result is None else str(result)
+        task_output = TaskOutput.model_construct(
             task_id=self.id,
-            raw=result,
+            raw=raw,
             pydantic=output_pydantic,
             json_dict=output_json,
         )
         self.output = task_output
-        self.processed_by_agents.add(agent.role)
+        if agent.role not in self.processed_by_agents:
+            self.processed_by_agents += (agent.role,)
 
         # self._set_end_execution_time(start_time)
 
@@ -427,4 +503,6 @@ class ConditionalTask(Task):
         return self.condition(context)
 
     def get_skipped_task_output(self):
-        return TaskOutput(task_id=self.id, raw="", pydantic=None, json_dict=None)
+        return TaskOutput.model_construct(
+            task_id=self.id, raw="", pydantic=None, json_dict=None
+        )
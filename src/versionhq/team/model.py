@@ -1,12 +1,12 @@
 import uuid
 import warnings
-import json
 from abc import ABC
 from enum import Enum
 from dotenv import load_dotenv
 from concurrent.futures import Future
 from hashlib import md5
 from typing import Any, Dict, List, TYPE_CHECKING, Callable, Optional, Tuple, Union
+import orjson
 from pydantic import (
     UUID4,
     InstanceOf,
@@ -20,7 +20,7 @@ from pydantic import (
 from pydantic_core import PydanticCustomError
 
 from versionhq.agent.model import Agent
-from versionhq.task.model import Task, TaskOutput, ConditionalTask, TaskOutputFormat
+from versionhq.task.model import Task, TaskOutput, ConditionalTask
 from versionhq.task.formatter import create_raw_outputs
 from versionhq.team.team_planner import TeamPlanner
 from versionhq._utils.logger import Logger
@@ -99,12 +99,12 @@ class TeamOutput(BaseModel):
             raise KeyError(f"Key '{key}' not found in the team output.")
 
     @property
-    def json(self) -> Optional[str]:
-        if self.tasks_output[-1].output_format != TaskOutputFormat.JSON:
+    def json(self) -> str:
+        if self.json_dict is None:
             raise ValueError(
                 "No JSON output found in the final task. Please make sure to set the output_json property in the final task in your team."
             )
-        return json.dumps(self.json_dict)
+        return orjson.dumps(self.json_dict, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -211,7 +211,9 @@ class CacheTool(BaseModel):
     """
 
     name: str = "Hit Cache"
-    cache_handler: CacheHandler = Field(default_factory=CacheHandler)
+    cache_handler: InstanceOf[CacheHandler] = Field(
+        default_factory=CacheHandler, exclude=True
+    )
 
     def hit_cache(self, key):
         split = key.split("tool:")
@@ -0,0 +1,47 @@
+import copy
+
+from versionhq._utils import cache_handler
+from versionhq._utils.cache_handler import CacheHandler
+
+
+def test_evict_least_recently_used():
+    cache = CacheHandler(maxsize=2)
+    cache.add(tool="tool", input="a", output=1)
+    cache.add(tool="tool", input="b", output=2)
+    cache.read(tool="tool", input="a")
+    cache.add(tool="tool", input="c", output=3)
+
+    assert cache.read(tool="tool", input="a") == 1
+    assert cache.read(tool="tool", input="b") is None
+    assert cache.read(tool="tool", input="c") == 3
+
+
+def test_expire_entries_after_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(cache_handler.time, "monotonic", lambda: now)
+    cache = CacheHandler(ttl=10)
+    cache.add(tool="tool", input="a", output=1)
+
+    now = 105.0
+    assert cache.read(tool="tool", input="a") == 1
+
+    now = 111.0
+    assert cache.read(tool="tool", input="a") is None
+
+
+def test_match_inputs_by_string_form():
+    cache = CacheHandler()
+    cache.add(tool="tool", input=1, output="int")
+    cache.add(tool="tool", input=({"a": 1},), output="unhashable")
+
+    assert cache.read(tool="tool", input="1") == "int"
+    assert cache.read(tool="tool", input=({"a": 1},)) == "unhashable"
+
+
+def test_deepcopy():
+    cache = CacheHandler(maxsize=3, ttl=5)
+    cache.add(tool="tool", input="a", output=1)
+    copied = copy.deepcopy(cache)
+
+    assert copied.read(tool="tool", input="a") == 1
+    assert (copied.maxsize, copied.ttl) == (3, 5)
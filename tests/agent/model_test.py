@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+import pytest
+
+from versionhq.agent.model import Agent
+from versionhq.task.model import Task
+
+
+def _fake_responses(*responses):
+    calls = []
+
+    def fake_call(**kwargs):
+        calls.append(kwargs)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    return fake_call, calls
+
+
+def _demo_agent(**kwargs) -> Agent:
+    return Agent(
+        role="Demo Agent",
+        goal="My amazing goals",
+        backstory="My amazing backstory",
+        llm="gpt-4o-mini",
+        **kwargs,
+    )
+
+
+def test_retry_on_empty_response(monkeypatch):
+    agent = _demo_agent(max_retry_limit=2)
+    fake_call, calls = _fake_responses("", json.dumps({"output": "ok"}))
+    monkeypatch.setattr(agent.llm, "call", fake_call)
+
+    res = agent.invoke(prompts="Demo", output_formats=[], response_fields=[])
+    assert res == {"output": '{"output": "ok"}'}
+    assert len(calls) == 2
+
+
+def test_stop_retrying_at_max_retry_limit(monkeypatch):
+    agent = _demo_agent(max_retry_limit=2)
+    fake_call, calls = _fake_responses("")
+    monkeypatch.setattr(agent.llm, "call", fake_call)
+
+    res = agent.invoke(prompts="Demo", output_formats=[], response_fields=[])
+    assert res == {"output": ""}
+    assert len(calls) == 3
+
+
+def test_raise_on_empty_response_without_retry(monkeypatch):
+    agent = _demo_agent(max_retry_limit=1)
+    fake_call, calls = _fake_responses("", json.dumps({"output": "ok"}))
+    monkeypatch.setattr(agent.llm, "call", fake_call)
+
+    with pytest.raises(ValueError, match="None or empty"):
+        agent.invoke(prompts="Demo", output_formats=[], response_fields=[])
+    assert len(calls) == 1
+
+
+def test_execute_async_coro(monkeypatch):
+    agent = _demo_agent(max_retry_limit=2)
+    fake_call, calls = _fake_responses("", json.dumps({"output": "ok"}))
+
+    async def fake_call_async(**kwargs):
+        return fake_call(**kwargs)
+
+    monkeypatch.setattr(agent.llm, "call_async", fake_call_async)
+
+    task = Task(description="Demo task")
+    res = asyncio.run(task.execute_async_coro(agent=agent))
+    assert res.raw == '{"output": "ok"}'
+    assert res.json_dict == {"output": "ok"}
+    assert len(calls) == 2
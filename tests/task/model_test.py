@@ -0,0 +1,127 @@
+import orjson
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from versionhq.task import TaskOutputFormat
+from versionhq.task.model import ResponseField, Task, TaskOutput
+
+
+class DemoOutput(BaseModel):
+    field_1: int
+
+
+def test_require_output_format():
+    with pytest.raises(ValidationError, match="missing_output_format"):
+        Task(
+            description="Demo task",
+            expected_output_json=False,
+            expected_output_pydantic=False,
+            expected_output_raw=False,
+        )
+
+
+def test_export_output_from_dict():
+    task = Task(description="Demo task", expected_output_pydantic=True)
+    assert task._export_output({"field_1": 1}) == ({"field_1": 1}, None)
+
+
+def test_export_output_from_pydantic():
+    task = Task(description="Demo task", expected_output_pydantic=True)
+    result = DemoOutput(field_1=1)
+    assert task._export_output(result) == ({"field_1": 1}, result)
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        ('{"field_1": 1}', {"field_1": 1}),
+        ("{'field_1': 1}", {"field_1": 1}),
+        ("not a json", None),
+        ("{[1]: 2}", None),
+        ("42", None),
+        ("[1, 2]", None),
+    ],
+)
+def test_export_output_from_str(result, expected):
+    task = Task(description="Demo task")
+    assert task._export_output(result) == (expected, None)
+
+
+def test_skip_parsing_when_json_is_not_expected():
+    task = Task(
+        description="Demo task", expected_output_json=False, expected_output_raw=True
+    )
+    assert task._export_output('{"field_1": 1}') == (None, None)
+
+
+def test_refresh_key_on_description_change():
+    task = Task(description="Demo task")
+    key = task.key
+    task.description = "Another task"
+    assert task.key != key
+
+
+def test_refresh_output_attributes_on_field_change():
+    task = Task(description="Demo task")
+    task.expected_output_raw = True
+    assert task.expected_output_formats == (
+        TaskOutputFormat.JSON,
+        TaskOutputFormat.RAW,
+    )
+
+    task.output_field_list = [ResponseField(title="field_1", type="int")]
+    assert isinstance(task.output_field_list, tuple)
+    assert '{"field_1":"your answer in int"}' in task.output_prompt
+
+
+def test_escape_field_title_in_output_prompt():
+    task = Task(
+        description="Demo task",
+        output_field_list=[ResponseField(title='field "1"', type="str")],
+    )
+    json_example = task.output_prompt.strip().splitlines()[-1].strip()
+    assert orjson.loads(json_example) == {'field "1"': "your answer in str"}
+
+
+def test_refresh_attributes_on_copy():
+    task = Task(description="Demo task")
+    key = task.key
+    copied = task.model_copy(
+        update={
+            "description": "Another task",
+            "expected_output_raw": True,
+            "output_field_list": [ResponseField(title="field_1", type="int")],
+        }
+    )
+    assert copied.key != key
+    assert TaskOutputFormat.RAW in copied.expected_output_formats
+    assert isinstance(copied.output_field_list, tuple)
+    assert '{"field_1":"your answer in int"}' in copied.output_prompt
+    assert task.expected_output_formats == (TaskOutputFormat.JSON,)
+
+
+def test_set_attributes_from_config():
+    task = Task(
+        description="Demo task",
+        config={
+            "expected_output_raw": True,
+            "output_field_list": [ResponseField(title="field_1", type="int")],
+        },
+    )
+    assert TaskOutputFormat.RAW in task.expected_output_formats
+    assert isinstance(task.output_field_list, tuple)
+    assert '{"field_1":"your answer in int"}' in task.output_prompt
+
+
+def test_serialize_task_output_json():
+    output = TaskOutput(raw="Demo", json_dict={"field_1": 1, "field_2": "a"})
+    assert output.json_bytes == b'{"field_1":1,"field_2":"a"}'
+    assert output.json == '{"field_1":1,"field_2":"a"}'
+
+
+def test_raise_on_task_output_json_without_json_dict():
+    output = TaskOutput(raw="Demo")
+    with pytest.raises(ValueError, match="Invalid output format"):
+        output.json
+    with pytest.raises(ValueError, match="Invalid output format"):
+        output.json_bytes
@@ -2,7 +2,7 @@ import os
 from dotenv import load_dotenv
 from typing import Union, Any, Dict
 
-from vesionhq.team.model import TeamOutput
+from versionhq.team.model import TeamOutput
 
 
 load_dotenv(override=True)
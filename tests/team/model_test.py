@@ -0,0 +1,19 @@
+import pytest
+
+from versionhq.task.model import TaskOutput
+from versionhq.team.model import TeamOutput
+
+
+def test_serialize_team_output_json():
+    output = TeamOutput(
+        raw="Demo",
+        json_dict={"field_1": 1},
+        task_output_list=[TaskOutput(raw="Demo", json_dict={"field_1": 1})],
+    )
+    assert output.json == '{"field_1":1}'
+
+
+def test_raise_on_team_output_json_without_json_dict():
+    output = TeamOutput(raw="Demo", task_output_list=[TaskOutput(raw="Demo")])
+    with pytest.raises(ValueError, match="No JSON output found"):
+        output.json